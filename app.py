@@ -1,13 +1,41 @@
+from asgiref.wsgi import WsgiToAsgi
+from cachetools import TTLCache, cached
 from flask import Flask, render_template, request, jsonify
-import boto3
-import json
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+import functools
+import msgspec
+import numpy as np
+import orjson
 import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
+from typing import Annotated, get_type_hints
 import logging
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster encode/decode"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-secret-key-here')
 
+# Compress responses above 500 bytes, preferring brotli over gzip
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,164 +50,407 @@ AWS_ACCESS_KEY_ID = os.environ.get('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.environ.get('AWS_SECRET_ACCESS_KEY')
 USE_MOCK_PREDICTIONS = os.environ.get('USE_MOCK_PREDICTIONS', 'false').lower() == 'true'
 
-# Initialize SageMaker clients (only if credentials are available)
-sagemaker_runtime = None
-sagemaker_client = None
+# When set, serve predictions in-process from the model artifact in this
+# directory instead of calling the SageMaker endpoint
+MODEL_LOCAL_PATH = os.environ.get('MODEL_LOCAL_PATH')
+
+# Micro-batching configuration: concurrent /predict requests arriving within
+# BATCH_TIMEOUT_MS of each other share a single invoke_endpoint call
+BATCH_SIZE = int(os.environ.get('BATCH_SIZE', 32))
+BATCH_TIMEOUT_MS = float(os.environ.get('BATCH_TIMEOUT_MS', 10))
+PREDICT_TIMEOUT_SEC = float(os.environ.get('PREDICT_TIMEOUT_SEC', 10))
+PREDICTION_CACHE_SIZE = int(os.environ.get('PREDICTION_CACHE_SIZE', 4096))
+WARMUP_INTERVAL_SEC = float(os.environ.get('WARMUP_INTERVAL_SEC', 60))
+ENDPOINT_STATUS_TTL_SEC = float(os.environ.get('ENDPOINT_STATUS_TTL_SEC', 5))
+
+# SageMaker clients are created lazily on the first request that needs them.
+# Importing boto3 alone loads botocore's service models, so keeping it out of
+# module import removes that cost from cold starts and from mock-mode
+# deployments entirely.
+if USE_MOCK_PREDICTIONS:
+    logger.info("Using mock predictions (USE_MOCK_PREDICTIONS=true)")
+elif not (AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY):
+    logger.warning("AWS credentials not found. Using mock predictions for testing.")
+    USE_MOCK_PREDICTIONS = True
+
+
+@functools.lru_cache(maxsize=1)
+def get_session():
+    """Create the shared boto3 session on first use"""
+    import boto3
+
+    return boto3.Session(
+        region_name=AWS_REGION,
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_client_config():
+    """Shared botocore config: pooled, kept-alive connections with bounded retries"""
+    import botocore.config
+
+    return botocore.config.Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={'max_attempts': 2, 'mode': 'standard'}
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_runtime():
+    """Return the SageMaker runtime client, creating it on first use.
 
-if AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY and not USE_MOCK_PREDICTIONS:
+    All prediction traffic must go through this client so invoke_endpoint
+    calls reuse the pooled, kept-alive connections; don't create ad-hoc
+    clients inside request handlers.
+    """
+    if USE_MOCK_PREDICTIONS:
+        return None
     try:
-        sagemaker_runtime = boto3.client(
-            'sagemaker-runtime',
-            region_name=AWS_REGION,
-            aws_access_key_id=AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=AWS_SECRET_ACCESS_KEY
-        )
-        
-        sagemaker_client = boto3.client(
-            'sagemaker',
-            region_name=AWS_REGION,
-            aws_access_key_id=AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=AWS_SECRET_ACCESS_KEY
-        )
-        logger.info("AWS SageMaker clients initialized successfully")
+        runtime = get_session().client('sagemaker-runtime', config=get_client_config())
+        logger.info("SageMaker runtime client initialized")
+        _ensure_pinger()
+        return runtime
     except Exception as e:
-        logger.warning(f"Failed to initialize AWS clients: {e}")
-        USE_MOCK_PREDICTIONS = True
-else:
+        logger.warning(f"Failed to initialize SageMaker runtime client: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_sm_client():
+    """Return the SageMaker management client, creating it on first use"""
     if USE_MOCK_PREDICTIONS:
-        logger.info("Using mock predictions (USE_MOCK_PREDICTIONS=true)")
-    else:
-        logger.warning("AWS credentials not found. Using mock predictions for testing.")
-        USE_MOCK_PREDICTIONS = True
+        return None
+    try:
+        client = get_session().client('sagemaker', config=get_client_config())
+        logger.info("SageMaker client initialized")
+        return client
+    except Exception as e:
+        logger.warning(f"Failed to initialize SageMaker client: {e}")
+        return None
+
+
+# Constrained field types, validated in C during decode: magnitudes must
+# be positive where zero is meaningless, while flags are strictly 0/1 (a
+# zero there is legitimate data, not a missing field)
+Positive = Annotated[int, msgspec.Meta(ge=1)]
+NonNegative = Annotated[int, msgspec.Meta(ge=0)]
+Flag = Annotated[int, msgspec.Meta(ge=0, le=1)]
 
 
-def prepare_features(form_data):
+class Features(msgspec.Struct):
     """
-    Prepare features from form data to match model input format.
-    Maps form fields to the expected feature array.
+    Typed request schema; msgspec decodes and validates JSON bodies in C.
+    Field order matches the model's expected 20-feature input array.
     """
-    # Feature order (20 features):
-    # battery_power, blue, clock_speed, dual_sim, fc, four_g, int_memory,
-    # m_dep, mobile_wt, n_cores, pc, px_height, px_width, ram, sc_h, sc_w,
-    # talk_time, three_g, touch_screen, wifi
-    
-    features = [
-        int(form_data.get('battery_power', 0)),
-        int(form_data.get('blue', 0)),
-        float(form_data.get('clock_speed', 0)),
-        int(form_data.get('dual_sim', 0)),
-        int(form_data.get('fc', 0)),  # Front Camera megapixels
-        int(form_data.get('four_g', 0)),
-        int(form_data.get('int_memory', 0)),  # Internal Memory in GB
-        float(form_data.get('m_dep', 0)),  # Mobile Depth in cm
-        int(form_data.get('mobile_wt', 0)),  # Weight in grams
-        int(form_data.get('n_cores', 0)),
-        int(form_data.get('pc', 0)),  # Primary Camera megapixels
-        int(form_data.get('px_height', 0)),  # Pixel Resolution Height
-        int(form_data.get('px_width', 0)),  # Pixel Resolution Width
-        int(form_data.get('ram', 0)),  # RAM in MB
-        int(form_data.get('sc_h', 0)),  # Screen Height in cm
-        int(form_data.get('sc_w', 0)),  # Screen Width in cm
-        int(form_data.get('talk_time', 0)),  # Talk time in hours
-        int(form_data.get('three_g', 0)),
-        int(form_data.get('touch_screen', 0)),
-        int(form_data.get('wifi', 0))
-    ]
-    
-    return features
+    battery_power: Positive
+    blue: Flag
+    clock_speed: Annotated[float, msgspec.Meta(gt=0)]
+    dual_sim: Flag
+    fc: NonNegative  # Front Camera megapixels
+    four_g: Flag
+    int_memory: Positive  # Internal Memory in GB
+    m_dep: Annotated[float, msgspec.Meta(ge=0)]  # Mobile Depth in cm
+    mobile_wt: Positive  # Weight in grams
+    n_cores: Positive
+    pc: NonNegative  # Primary Camera megapixels
+    px_height: NonNegative  # Pixel Resolution Height
+    px_width: Positive  # Pixel Resolution Width
+    ram: Positive  # RAM in MB
+    sc_h: Positive  # Screen Height in cm
+    sc_w: NonNegative  # Screen Width in cm
+    talk_time: Positive  # Talk time in hours
+    three_g: Flag
+    touch_screen: Flag
+    wifi: Flag
+
+
+# Per-field %d/%.4f chosen from the Features schema once at import; a
+# single C-level `fmt % tuple` beats boxing every value through str().
+# get_type_hints strips the Annotated constraint metadata.
+_CSV_FMT = ','.join(
+    '%.4f' if ftype is float else '%d'
+    for ftype in get_type_hints(Features).values()
+)
+
+
+def prepare_features(req):
+    """
+    Decode and validate the request into the model's feature list.
+    Raises msgspec.ValidationError on missing or mistyped fields.
+    """
+    # strict=False coerces the string values HTML forms submit
+    if req.is_json:
+        feat = msgspec.json.decode(req.get_data(), type=Features, strict=False)
+    else:
+        feat = msgspec.convert(dict(req.form), Features, strict=False)
+    return feat, list(msgspec.structs.astuple(feat))
+
+
+# Score thresholds mapping the rule-based score to price ranges 0-3
+_SCORE_THRESHOLDS = np.array([2.0, 4.0, 6.0])
 
 
 def mock_predict_price_range(features):
     """
     Mock prediction function for testing without AWS
-    Simple rule-based prediction based on key features
+    Branchless rule-based scoring on key features; accepts a single
+    feature vector or a 2-D array of feature rows for batch scoring
     """
-    ram = features[13]  # RAM in MB
-    battery = features[0]  # Battery power
-    pc = features[10]  # Primary camera
-    px_height = features[11]  # Pixel height
-    px_width = features[12]  # Pixel width
-    
-    # Simple rule-based classification
-    score = 0
-    
-    # RAM contribution
-    if ram >= 6144:  # 6GB+
-        score += 3
-    elif ram >= 4096:  # 4GB+
-        score += 2
-    elif ram >= 3072:  # 3GB+
-        score += 1
-    
-    # Battery contribution
-    if battery >= 4000:
-        score += 1
-    elif battery >= 3000:
-        score += 0.5
-    
-    # Camera contribution
-    if pc >= 48:
-        score += 2
-    elif pc >= 24:
-        score += 1
-    elif pc >= 12:
-        score += 0.5
-    
-    # Display resolution
-    if px_height >= 2400 and px_width >= 1080:
-        score += 1
-    elif px_height >= 1920:
-        score += 0.5
-    
-    # Map score to price range (0-3)
-    if score >= 6:
-        prediction = 3  # Premium
-    elif score >= 4:
-        prediction = 2  # Upper mid-range
-    elif score >= 2:
-        prediction = 1  # Lower mid-range
-    else:
-        prediction = 0  # Budget
-    
-    return {'predictions': [{'predicted_label': prediction}]}
+    f = np.atleast_2d(np.asarray(features, dtype=float))
+
+    ram = f[:, 13]  # RAM in MB
+    battery = f[:, 0]  # Battery power
+    pc = f[:, 10]  # Primary camera
+    px_height = f[:, 11]  # Pixel height
+    px_width = f[:, 12]  # Pixel width
+
+    # Each comparison contributes its weight; sums reproduce the old
+    # if/elif ladders (e.g. ram >= 6144 scores 1+1+1 = 3). The explicit
+    # float weights matter: adding bare boolean arrays is a logical OR.
+    score = (
+        1.0 * (ram >= 3072) + 1.0 * (ram >= 4096) + 1.0 * (ram >= 6144)
+        + 0.5 * (battery >= 3000) + 0.5 * (battery >= 4000)
+        + 0.5 * (pc >= 12) + 0.5 * (pc >= 24) + 1.0 * (pc >= 48)
+    )
+
+    # Display resolution: full point for high-res, half point otherwise
+    # for tall screens
+    high_res = (px_height >= 2400) & (px_width >= 1080)
+    score += 1.0 * high_res + 0.5 * (~high_res & (px_height >= 1920))
+
+    # Map scores to price ranges (0-3) in one shot
+    predictions = np.searchsorted(_SCORE_THRESHOLDS, score, side='right')
+
+    return {'predictions': [{'predicted_label': int(pred)} for pred in predictions]}
+
+
+class _PendingPrediction:
+    """A single request waiting for its slot in the next endpoint batch"""
+    __slots__ = ('features', 'event', 'result', 'error')
+
+    def __init__(self, features):
+        self.features = features
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_batch_queue = queue.Queue()
+_batch_worker_lock = threading.Lock()
+_batch_worker_started = False
+
+
+def _ensure_batch_worker():
+    """Start the batching worker thread once, on the first AWS prediction"""
+    global _batch_worker_started
+    if _batch_worker_started:
+        return
+    with _batch_worker_lock:
+        if not _batch_worker_started:
+            threading.Thread(target=_batch_worker, daemon=True).start()
+            _batch_worker_started = True
+
+
+def _invoke_batch(pending):
+    """Send one CSV payload for all pending requests and fan results back"""
+    runtime = get_runtime()
+    payload = '\n'.join(_CSV_FMT % tuple(p.features) for p in pending)
+
+    logger.info(f"Calling SageMaker endpoint: {SAGEMAKER_ENDPOINT} (batch of {len(pending)})")
+
+    response = runtime.invoke_endpoint(
+        EndpointName=SAGEMAKER_ENDPOINT,
+        ContentType='text/csv',
+        Body=payload
+    )
+
+    # Parse the response (orjson accepts bytes, so no decode step)
+    result = orjson.loads(response['Body'].read())
+    predictions = result.get('predictions', []) if isinstance(result, dict) else []
+
+    if len(predictions) != len(pending):
+        raise ValueError(
+            f"Endpoint returned {len(predictions)} predictions for a batch of {len(pending)}"
+        )
+
+    for p, prediction in zip(pending, predictions):
+        p.result = {'predictions': [prediction]}
+
+
+def _batch_worker():
+    """Aggregate queued requests into endpoint batches.
+
+    Blocks for the first request, then keeps collecting until the batch is
+    full or BATCH_TIMEOUT_MS has elapsed, so a lone request only ever waits
+    the batch timeout.
+    """
+    timeout = BATCH_TIMEOUT_MS / 1000.0
+    while True:
+        pending = [_batch_queue.get()]
+        deadline = time.monotonic() + timeout
+        while len(pending) < BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                pending.append(_batch_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            _invoke_batch(pending)
+        except Exception as e:
+            for p in pending:
+                p.error = e
+        for p in pending:
+            p.event.set()
+
+
+# Fixed canary vector sent by the warm-up pinger (not a real request)
+_CANARY_FEATURES = [1000, 0, 1.0, 0, 5, 1, 32, 0.5, 150, 4, 12, 1280, 720,
+                    2048, 12, 6, 10, 1, 1, 1]
+
+# Last warm-up ping outcome, surfaced by /health
+_last_ping = {'ok': None, 'error': None, 'timestamp': None}
+
+_pinger_lock = threading.Lock()
+_pinger_started = False
+
+
+def _pinger():
+    """Periodically invoke the endpoint to keep pooled connections warm
+
+    Also records the last outcome so /health can report endpoint
+    degradation without an on-demand AWS call.
+    """
+    while True:
+        try:
+            _invoke_batch([_PendingPrediction(_CANARY_FEATURES)])
+            _last_ping.update(ok=True, error=None, timestamp=datetime.now().isoformat())
+        except Exception as e:
+            _last_ping.update(ok=False, error=str(e), timestamp=datetime.now().isoformat())
+            logger.warning(f"Endpoint warm-up ping failed: {e}")
+        time.sleep(WARMUP_INTERVAL_SEC)
+
+
+def _ensure_pinger():
+    """Start the warm-up pinger thread once, after the runtime client exists"""
+    global _pinger_started
+    if _pinger_started:
+        return
+    with _pinger_lock:
+        if not _pinger_started:
+            threading.Thread(target=_pinger, daemon=True).start()
+            _pinger_started = True
+
+
+@functools.lru_cache(maxsize=1)
+def get_local_artifact():
+    """Load the local model artifact once when MODEL_LOCAL_PATH is set"""
+    if not MODEL_LOCAL_PATH:
+        return None
+    try:
+        from sagemaker_train import model_fn
+
+        artifact = model_fn(MODEL_LOCAL_PATH)
+        logger.info(f"Loaded local model artifact from {MODEL_LOCAL_PATH}")
+        return artifact
+    except Exception as e:
+        logger.warning(f"Failed to load local model artifact: {e}")
+        return None
+
+
+# Requests currently in flight to the endpoint, keyed by their CSV body;
+# concurrent identical requests share the first one's result
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _invoke_queued(features):
+    """Enqueue one feature vector for the batch worker and await its slot"""
+    _ensure_batch_worker()
+    pending = _PendingPrediction(features)
+    _batch_queue.put(pending)
+
+    if not pending.event.wait(timeout=PREDICT_TIMEOUT_SEC):
+        raise TimeoutError(f"Prediction timed out after {PREDICT_TIMEOUT_SEC}s")
+    if pending.error is not None:
+        raise pending.error
+    return pending.result
+
+
+def _invoke_coalesced(features):
+    """Single-flight invocation: while one request for a given feature
+    vector is outstanding, identical arrivals wait on its Future instead
+    of spawning duplicate endpoint calls (thundering-herd protection that
+    complements the LRU cache's handling of serial repeats)"""
+    key = _CSV_FMT % tuple(features)
+
+    with _inflight_lock:
+        fut = _inflight.get(key)
+        if fut is not None:
+            leader = False
+        else:
+            fut = Future()
+            _inflight[key] = fut
+            leader = True
+
+    if not leader:
+        return fut.result(timeout=PREDICT_TIMEOUT_SEC)
+
+    try:
+        result = _invoke_queued(features)
+        fut.set_result(result)
+        return result
+    except Exception as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
 
 
 def predict_price_range(features):
     """
-    Call SageMaker endpoint to get price prediction
-    Falls back to mock prediction if AWS is not available
+    Get a price prediction, preferring the local in-process model when one
+    is configured, then the SageMaker endpoint via the batching queue, and
+    finally the mock fallback if AWS is not available
     """
-    if USE_MOCK_PREDICTIONS or sagemaker_runtime is None:
+    artifact = get_local_artifact()
+    if artifact is not None:
+        try:
+            from sagemaker_train import predict_fn
+
+            pred = predict_fn(np.asarray([features], dtype=np.float32), artifact)
+            return {'predictions': [{'predicted_label': int(pred[0])}]}
+        except Exception as e:
+            logger.error(f"Local prediction failed: {e}")
+
+    runtime = get_runtime()
+    if runtime is None:
         logger.info("Using mock prediction (AWS not configured)")
         return mock_predict_price_range(features)
-    
+
     try:
-        # Format data for SageMaker endpoint (CSV format)
-        payload = ','.join(map(str, features))
-        
-        logger.info(f"Calling SageMaker endpoint: {SAGEMAKER_ENDPOINT}")
-        logger.info(f"Payload: {payload}")
-        
-        # Invoke the endpoint
-        response = sagemaker_runtime.invoke_endpoint(
-            EndpointName=SAGEMAKER_ENDPOINT,
-            ContentType='text/csv',
-            Body=payload
-        )
-        
-        # Parse the response
-        result = json.loads(response['Body'].read().decode())
-        
+        result = _invoke_coalesced(features)
         logger.info(f"Prediction result: {result}")
-        
         return result
-        
+
     except Exception as e:
         logger.error(f"Error calling SageMaker endpoint: {str(e)}")
         logger.info("Falling back to mock prediction")
         return mock_predict_price_range(features)
 
 
+@functools.lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def _predict_cached(features_tuple):
+    """Exact-match memoization: repeat feature vectors skip the endpoint"""
+    return predict_price_range(list(features_tuple))
+
+
 @app.route('/')
 def index():
     """Render the main page"""
@@ -190,21 +461,23 @@ def index():
 def predict():
     """Handle prediction requests"""
     try:
-        # Get form data
-        form_data = request.json if request.is_json else request.form
-        
-        # Prepare features
-        features = prepare_features(form_data)
-        
-        # Validate features
-        if not all(features):
+        # Decode and validate the request body; the schema's range
+        # constraints are checked during decode, so bad values 400 here
+        # with the offending field named instead of raising downstream
+        try:
+            feat, features = prepare_features(request)
+        except msgspec.ValidationError as e:
             return jsonify({
                 'success': False,
-                'error': 'Please fill in all fields'
+                'error': f'Invalid input: {e}'
             }), 400
-        
-        # Get prediction from SageMaker
-        prediction_result = predict_price_range(features)
+
+        # Get prediction from SageMaker (cached for repeat inputs;
+        # clients can send Cache-Control: no-cache to force a fresh call)
+        if 'no-cache' in request.headers.get('Cache-Control', ''):
+            prediction_result = predict_price_range(features)
+        else:
+            prediction_result = _predict_cached(tuple(features))
         
         # Map prediction to price range labels
         price_ranges = {
@@ -237,10 +510,19 @@ def predict():
         }), 500
 
 
+@cached(TTLCache(maxsize=4, ttl=ENDPOINT_STATUS_TTL_SEC), lock=threading.Lock())
+def _describe_endpoint(endpoint_name):
+    """describe_endpoint with a short TTL so repeat health probes reuse the
+    last status instead of hitting the rate-limited AWS API; failures are
+    not cached and raise through to the caller"""
+    return get_sm_client().describe_endpoint(EndpointName=endpoint_name)
+
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
-    if USE_MOCK_PREDICTIONS or sagemaker_client is None:
+    sm_client = get_sm_client()
+    if sm_client is None:
         return jsonify({
             'status': 'healthy',
             'mode': 'mock',
@@ -250,13 +532,14 @@ def health():
     
     try:
         # Check if SageMaker endpoint is available
-        endpoint_status = sagemaker_client.describe_endpoint(EndpointName=SAGEMAKER_ENDPOINT)
+        endpoint_status = _describe_endpoint(SAGEMAKER_ENDPOINT)
         status = endpoint_status['EndpointStatus']
         
         return jsonify({
             'status': 'healthy' if status == 'InService' else 'degraded',
             'mode': 'aws',
             'endpoint_status': status,
+            'last_ping': _last_ping,
             'timestamp': datetime.now().isoformat()
         })
     except Exception as e:
@@ -271,7 +554,8 @@ def health():
 @app.route('/endpoint-status', methods=['GET'])
 def endpoint_status():
     """Check SageMaker endpoint status"""
-    if USE_MOCK_PREDICTIONS or sagemaker_client is None:
+    sm_client = get_sm_client()
+    if sm_client is None:
         return jsonify({
             'success': True,
             'mode': 'mock',
@@ -281,7 +565,7 @@ def endpoint_status():
         })
     
     try:
-        response = sagemaker_client.describe_endpoint(EndpointName=SAGEMAKER_ENDPOINT)
+        response = _describe_endpoint(SAGEMAKER_ENDPOINT)
         return jsonify({
             'success': True,
             'mode': 'aws',
@@ -297,6 +581,13 @@ def endpoint_status():
         }), 500
 
 
+# ASGI entry point so the app can run under an async server, e.g.
+#   uvicorn app:asgi_app --workers 2 --loop uvloop
+# Handlers execute in an executor thread pool, so slow SageMaker calls no
+# longer pin one WSGI worker per in-flight request.
+asgi_app = WsgiToAsgi(app)
+
+
 if __name__ == '__main__':
     # Check if running in development mode
     debug_mode = os.environ.get('FLASK_ENV') == 'development'
@@ -0,0 +1,83 @@
+"""
+Shared feature schema and engineering for the Mobile Price Predictor
+Single source of truth for train_model.py and sagemaker_train.py
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy fallback stays correct
+    njit = None
+    prange = range
+
+
+BASE_FEATURE_COLUMNS = [
+    'battery_power', 'blue', 'clock_speed', 'dual_sim', 'fc',
+    'four_g', 'int_memory', 'm_dep', 'mobile_wt', 'n_cores',
+    'pc', 'px_height', 'px_width', 'ram', 'sc_h', 'sc_w',
+    'talk_time', 'three_g', 'touch_screen', 'wifi'
+]
+
+ENGINEERED_FEATURE_COLUMNS = [
+    'pixel_area', 'ppi', 'screen_ratio', 'ram_per_core', 'battery_per_weight'
+]
+
+ALL_FEATURE_COLUMNS = BASE_FEATURE_COLUMNS + ENGINEERED_FEATURE_COLUMNS
+
+
+def _engineer_kernel(px_h, px_w, sc_h, sc_w, ram, n_cores, batt, wt, out):
+    """Numeric core writing the five derived columns into out, row by row"""
+    for i in prange(px_h.shape[0]):
+        out[i, 0] = px_h[i] * px_w[i]
+        out[i, 1] = math.hypot(px_h[i], px_w[i]) / (sc_h[i] if sc_h[i] != 0 else 1.0)
+        out[i, 2] = sc_h[i] / sc_w[i] if sc_w[i] != 0 else 0.0
+        out[i, 3] = ram[i] / n_cores[i] if n_cores[i] != 0 else 0.0
+        out[i, 4] = batt[i] / wt[i] if wt[i] != 0 else 0.0
+
+
+def _engineer_numpy(px_h, px_w, sc_h, sc_w, ram, n_cores, batt, wt, out):
+    """Vectorized fallback used when numba is not installed"""
+    pixel_area, ppi, screen_ratio, ram_per_core, battery_per_weight = out.T
+
+    np.multiply(px_h, px_w, out=pixel_area)
+    # Where sc_h == 0 the untouched hypot value stands, i.e. division by 1
+    np.hypot(px_h, px_w, out=ppi)
+    np.divide(ppi, sc_h, out=ppi, where=sc_h != 0)
+    # Zero-denominator rows keep the preallocated zeros
+    np.divide(sc_h, sc_w, out=screen_ratio, where=sc_w != 0)
+    np.divide(ram, n_cores, out=ram_per_core, where=n_cores != 0)
+    np.divide(batt, wt, out=battery_per_weight, where=wt != 0)
+
+
+if njit is not None:
+    _engineer = njit(parallel=True, fastmath=True, cache=True)(_engineer_kernel)
+else:
+    _engineer = _engineer_numpy
+
+
+def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Append the engineered feature columns to a base-feature DataFrame"""
+    df = df.copy()
+
+    missing_columns = [col for col in BASE_FEATURE_COLUMNS if col not in df.columns]
+    if missing_columns:
+        raise ValueError(f"Missing required feature columns: {missing_columns}")
+
+    base = df[BASE_FEATURE_COLUMNS].to_numpy(dtype=np.float32)
+    col = {name: base[:, i] for i, name in enumerate(BASE_FEATURE_COLUMNS)}
+
+    out = np.zeros((len(df), len(ENGINEERED_FEATURE_COLUMNS)), dtype=np.float32)
+    _engineer(
+        col['px_height'], col['px_width'], col['sc_h'], col['sc_w'],
+        col['ram'], col['n_cores'], col['battery_power'], col['mobile_wt'],
+        out
+    )
+
+    for i, name in enumerate(ENGINEERED_FEATURE_COLUMNS):
+        df[name] = out[:, i]
+
+    return df
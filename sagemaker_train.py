@@ -3,61 +3,86 @@ SageMaker Training Script
 This script is used by AWS SageMaker to train the model
 """
 
+import io
 import os
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
+import lightgbm as lgb
 from sklearn.metrics import accuracy_score
 import joblib
 import json
 
+from features_common import (
+    BASE_FEATURE_COLUMNS,
+    ENGINEERED_FEATURE_COLUMNS,
+    ALL_FEATURE_COLUMNS,
+    engineer_features,
+)
+
+def export_compiled_model(model, model_dir):
+    """Compile the fitted booster to a native shared library with treelite.
+
+    Best-effort: serving falls back to the pickled model if treelite or a
+    toolchain is unavailable, so failures here only cost the speedup.
+    """
+    try:
+        import treelite
+
+        tl_model = treelite.Model.from_lightgbm(model.booster_)
+        libpath = os.path.join(model_dir, 'model.so')
+        tl_model.export_lib(
+            toolchain='gcc',
+            libpath=libpath,
+            params={'parallel_comp': 4},
+            verbose=False
+        )
+        print(f"Compiled predictor saved to {libpath}")
+    except Exception as e:
+        print(f"treelite compilation skipped: {e}")
 
-BASE_FEATURE_COLUMNS = [
-    'battery_power', 'blue', 'clock_speed', 'dual_sim', 'fc',
-    'four_g', 'int_memory', 'm_dep', 'mobile_wt', 'n_cores',
-    'pc', 'px_height', 'px_width', 'ram', 'sc_h', 'sc_w',
-    'talk_time', 'three_g', 'touch_screen', 'wifi'
-]
-
-ENGINEERED_FEATURE_COLUMNS = [
-    'pixel_area', 'ppi', 'screen_ratio', 'ram_per_core', 'battery_per_weight'
-]
-
-ALL_FEATURE_COLUMNS = BASE_FEATURE_COLUMNS + ENGINEERED_FEATURE_COLUMNS
-
-
-def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-
-    missing_columns = [col for col in BASE_FEATURE_COLUMNS if col not in df.columns]
-    if missing_columns:
-        raise ValueError(f"Missing required feature columns: {missing_columns}")
-
-    df['pixel_area'] = df['px_height'] * df['px_width']
-    df['ppi'] = np.sqrt(df['px_height'] ** 2 + df['px_width'] ** 2) / np.where(df['sc_h'] == 0, 1, df['sc_h'])
-    df['screen_ratio'] = np.where(df['sc_w'] == 0, 0, df['sc_h'] / df['sc_w'])
-    df['ram_per_core'] = np.where(df['n_cores'] == 0, 0, df['ram'] / df['n_cores'])
-    df['battery_per_weight'] = np.where(df['mobile_wt'] == 0, 0, df['battery_power'] / df['mobile_wt'])
-
-    return df
 
 # SageMaker reads the input data from specific environment variables
 def model_fn(model_dir):
-    """Load the model artifact from the model_dir directory"""
-    artifact = joblib.load(os.path.join(model_dir, 'model.pkl'))
-    if isinstance(artifact, dict) and 'model' in artifact:
-        return artifact
-    # Backwards compatibility for older artifacts
-    return {
-        'model': artifact,
-        'feature_columns': ALL_FEATURE_COLUMNS
-    }
+    """Load the model artifact from the model_dir directory.
+
+    mmap_mode='r' memory-maps the model's arrays so co-located workers
+    share pages instead of each reading the pickle into private RAM, and
+    only touched pages are faulted in on first use.
+    """
+    artifact = joblib.load(os.path.join(model_dir, 'model.pkl'), mmap_mode='r')
+    if not (isinstance(artifact, dict) and 'model' in artifact):
+        # Backwards compatibility for older artifacts
+        artifact = {
+            'model': artifact,
+            'feature_columns': ALL_FEATURE_COLUMNS
+        }
+
+    # Prefer the treelite-compiled predictor when the .so shipped with
+    # the artifact and the runtime is installed
+    libpath = os.path.join(model_dir, 'model.so')
+    if os.path.exists(libpath):
+        try:
+            import treelite_runtime
+
+            artifact['predictor'] = treelite_runtime.Predictor(libpath, nthread=1)
+            print(f"Loaded compiled predictor from {libpath}")
+        except Exception as e:
+            print(f"Falling back to pickled model, compiled predictor unavailable: {e}")
+
+    return artifact
 
 def input_fn(request_body, request_content_type):
     """Deserialize and prepare the prediction input"""
     if request_content_type == 'text/csv':
-        values = [float(x) for x in request_body.rstrip().split(',') if x]
-        return np.array(values, dtype=float).reshape(1, -1)
+        if isinstance(request_body, bytes):
+            request_body = request_body.decode()
+        request_body = request_body.rstrip()
+        # Parse in C rather than one float() call per field; multi-row
+        # payloads (batched requests) go through loadtxt in one pass
+        if '\n' in request_body:
+            arr = np.loadtxt(io.StringIO(request_body), delimiter=',', dtype=np.float32)
+            return np.atleast_2d(arr)
+        return np.fromstring(request_body, sep=',', dtype=np.float32).reshape(1, -1)
     raise ValueError(f"Content type {request_content_type} not supported")
 
 def predict_fn(input_data, artifact):
@@ -66,13 +91,22 @@ def predict_fn(input_data, artifact):
     feature_columns = artifact['feature_columns']
 
     if input_data.shape[1] == len(BASE_FEATURE_COLUMNS):
-        df = pd.DataFrame(input_data, columns=BASE_FEATURE_COLUMNS)
-        df = engineer_features(df)
-        data = df[feature_columns]
+        df = engineer_features(pd.DataFrame(input_data, columns=BASE_FEATURE_COLUMNS))
+        data = df[feature_columns].to_numpy(dtype=np.float32)
     else:
         # Assume engineered features already provided
-        data = pd.DataFrame(input_data, columns=feature_columns)
+        data = input_data
 
+    data = np.ascontiguousarray(data, dtype=np.float32)
+
+    predictor = artifact.get('predictor')
+    if predictor is not None:
+        import treelite_runtime
+
+        proba = np.atleast_2d(predictor.predict(treelite_runtime.DMatrix(data)))
+        return np.argmax(proba, axis=1)
+
+    # A contiguous float32 array skips sklearn's internal float64 copy
     prediction = model.predict(data)
     return prediction
 
@@ -107,18 +141,23 @@ if __name__ == '__main__':
     feature_columns = ALL_FEATURE_COLUMNS
     
     target_column = 'price_range'
-    
-    X = df[feature_columns]
-    y = df[target_column]
-    
+
+    # Contiguous float32 halves the cache footprint of the tree builder
+    X = np.ascontiguousarray(df[feature_columns].to_numpy(), dtype=np.float32)
+    y = df[target_column].to_numpy(dtype=np.int32)
+
     # Train model
-    print("Training Random Forest model...")
-    model = RandomForestClassifier(
-        n_estimators=300,
-        max_depth=None,
+    print("Training LightGBM model...")
+    model = lgb.LGBMClassifier(
+        n_estimators=400,
+        num_leaves=63,
+        learning_rate=0.05,
+        max_bin=255,
+        objective='multiclass',
         random_state=42,
         n_jobs=-1,
-        class_weight='balanced_subsample'
+        class_weight='balanced',
+        verbose=-1
     )
     
     model.fit(X, y)
@@ -137,3 +176,6 @@ if __name__ == '__main__':
     joblib.dump(artifact, model_path)
     print(f"Model saved to {model_path}")
 
+    # Ship a branchless compiled predictor next to the pickle when possible
+    export_compiled_model(model, model_dir)
+
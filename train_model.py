@@ -1,49 +1,33 @@
 """
 Training script for Mobile Price Predictor
-This script trains a Random Forest Classifier on mobile phone specifications
+This script trains a LightGBM classifier on mobile phone specifications
 """
 
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
+import lightgbm as lgb
 from sklearn.model_selection import train_test_split, RandomizedSearchCV
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 import joblib
 import argparse
 from typing import Tuple, List
 
-
-BASE_FEATURE_COLUMNS = [
-    'battery_power', 'blue', 'clock_speed', 'dual_sim', 'fc',
-    'four_g', 'int_memory', 'm_dep', 'mobile_wt', 'n_cores',
-    'pc', 'px_height', 'px_width', 'ram', 'sc_h', 'sc_w',
-    'talk_time', 'three_g', 'touch_screen', 'wifi'
-]
-
-ENGINEERED_FEATURE_COLUMNS = [
-    'pixel_area', 'ppi', 'screen_ratio', 'ram_per_core', 'battery_per_weight'
-]
+from features_common import (
+    BASE_FEATURE_COLUMNS,
+    ENGINEERED_FEATURE_COLUMNS,
+    engineer_features,
+)
 
 def load_data(mob_price_classification_train: str) -> pd.DataFrame:
     """Load training data from CSV"""
     df = pd.read_csv(mob_price_classification_train)
     return df
 
-def preprocess_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series, List[str]]:
+def preprocess_data(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, List[str]]:
     """Preprocess the data and engineer additional features."""
 
-    df = df.copy()
-
-    missing_columns = [col for col in BASE_FEATURE_COLUMNS if col not in df.columns]
-    if missing_columns:
-        raise ValueError(f"Missing required feature columns: {missing_columns}")
-
-    # Feature engineering to boost model performance
-    df['pixel_area'] = df['px_height'] * df['px_width']
-    df['ppi'] = np.sqrt(df['px_height'] ** 2 + df['px_width'] ** 2) / np.where(df['sc_h'] == 0, 1, df['sc_h'])
-    df['screen_ratio'] = np.where(df['sc_w'] == 0, 0, df['sc_h'] / df['sc_w'])
-    df['ram_per_core'] = np.where(df['n_cores'] == 0, 0, df['ram'] / df['n_cores'])
-    df['battery_per_weight'] = np.where(df['mobile_wt'] == 0, 0, df['battery_power'] / df['mobile_wt'])
+    # Feature engineering to boost model performance (shared JIT kernel)
+    df = engineer_features(df)
 
     feature_columns = BASE_FEATURE_COLUMNS + ENGINEERED_FEATURE_COLUMNS
 
@@ -54,28 +38,37 @@ def preprocess_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series, List[str
         if target_column is None:
             raise ValueError("Target column not found. Expected one of: price_range, price, target, price_category")
 
-    X = df[feature_columns]
-    y = df[target_column]
+    # Contiguous float32 halves the cache footprint of the tree builder
+    X = np.ascontiguousarray(df[feature_columns].to_numpy(), dtype=np.float32)
+    y = df[target_column].to_numpy(dtype=np.int32)
 
     return X, y, feature_columns
 
 def train_model(
-    X_train: pd.DataFrame,
-    y_train: pd.Series,
-    n_estimators: int = 300,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    n_estimators: int = 400,
     max_depth: int = None,
     random_state: int = 42,
     tune: bool = False,
     tune_iter: int = 20
 ):
-    """Train Random Forest model. Optionally run randomized hyperparameter search."""
+    """Train LightGBM model. Optionally run randomized hyperparameter search."""
 
-    base_model = RandomForestClassifier(
+    # Histogram-based boosting with max_bin=255 keeps feature storage in
+    # int8 bins; much faster to fit and predict than the old RandomForest
+    # and produces a far smaller artifact
+    base_model = lgb.LGBMClassifier(
         n_estimators=n_estimators,
-        max_depth=max_depth,
+        num_leaves=63,
+        learning_rate=0.05,
+        max_depth=-1 if max_depth is None else max_depth,
+        max_bin=255,
+        objective='multiclass',
         random_state=random_state,
         n_jobs=-1,
-        class_weight='balanced_subsample'
+        class_weight='balanced',
+        verbose=-1
     )
 
     if not tune:
@@ -84,10 +77,11 @@ def train_model(
 
     param_dist = {
         'n_estimators': [200, 300, 400, 500],
-        'max_depth': [10, 20, 30, None],
-        'min_samples_split': [2, 5, 10],
-        'min_samples_leaf': [1, 2, 4],
-        'max_features': ['sqrt', 'log2', None]
+        'num_leaves': [31, 63, 127],
+        'learning_rate': [0.02, 0.05, 0.1],
+        'min_child_samples': [5, 10, 20],
+        'subsample': [0.8, 1.0],
+        'colsample_bytree': [0.8, 1.0]
     }
 
     search = RandomizedSearchCV(
@@ -132,7 +126,7 @@ def main():
     parser.add_argument('--data', type=str, required=True, help='Path to training CSV file')
     parser.add_argument('--model-path', type=str, default='model.pkl', help='Path to save model')
     parser.add_argument('--test-size', type=float, default=0.2, help='Test set size (0-1)')
-    parser.add_argument('--n-estimators', type=int, default=300, help='Number of trees')
+    parser.add_argument('--n-estimators', type=int, default=400, help='Number of boosting rounds')
     parser.add_argument('--max-depth', type=int, default=None, help='Max depth of trees (None for full depth)')
     parser.add_argument('--tune', action='store_true', help='Enable randomized hyperparameter search')
     parser.add_argument('--tune-iter', type=int, default=20, help='Number of parameter settings sampled when tuning')